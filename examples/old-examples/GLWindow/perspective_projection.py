@@ -2,11 +2,41 @@
 NOTE: This example is from ModernGL 4 or earlier. We simply disable and archive them for now.
 """
 
-# import struct
+# import math
 
 # import GLWindow
 # import ModernGL
-# from pyrr import Matrix44
+# import numpy as np
+
+
+# def perspective_f32(fovy, ratio, near, far):
+#     # Regular row-major math layout, the upload transposes it to column-major
+#     ymul = 1.0 / math.tan(fovy * math.pi / 360.0)
+#     xmul = ymul / ratio
+#     zmul = (near + far) / (near - far)
+#     wmul = 2.0 * near * far / (near - far)
+#     return np.array([
+#         [xmul, 0.0, 0.0, 0.0],
+#         [0.0, ymul, 0.0, 0.0],
+#         [0.0, 0.0, zmul, wmul],
+#         [0.0, 0.0, -1.0, 0.0],
+#     ], dtype='<f4')
+
+
+# def look_at_f32(eye, target, up):
+#     eye = np.asarray(eye, dtype='<f4')
+#     forward = np.asarray(target, dtype='<f4') - eye
+#     forward /= np.linalg.norm(forward)
+#     side = np.cross(forward, up)
+#     side /= np.linalg.norm(side)
+#     upward = np.cross(side, forward)
+#     return np.array([
+#         [side[0], side[1], side[2], -np.dot(side, eye)],
+#         [upward[0], upward[1], upward[2], -np.dot(upward, eye)],
+#         [-forward[0], -forward[1], -forward[2], np.dot(forward, eye)],
+#         [0.0, 0.0, 0.0, 1.0],
+#     ], dtype='<f4')
+
 
 # wnd = GLWindow.create_window()
 # ctx = ModernGL.create_context()
@@ -15,7 +45,9 @@ NOTE: This example is from ModernGL 4 or earlier. We simply disable and archive
 #     ctx.vertex_shader('''
 #         #version 330
 
-#         uniform mat4 Mvp;
+#         layout(std140) uniform Matrices {
+#             mat4 Mvp;
+#         };
 
 #         in vec3 in_vert;
 #         in vec3 in_color;
@@ -39,30 +71,55 @@ NOTE: This example is from ModernGL 4 or earlier. We simply disable and archive
 #     '''),
 # ])
 
-# mvp = prog.uniforms['Mvp']
-
-# grid = bytearray()
-
-# for i in range(0, 32 + 1):
-#     grid += struct.pack('6f', i - 16.0, -16.0, 0.0, 0.0, 0.0, 0.0)
-#     grid += struct.pack('6f', i - 16.0, 16.0, 0.0, 0.0, 0.0, 0.0)
-#     grid += struct.pack('6f', -16.0, i - 16.0, 0.0, 0.0, 0.0, 0.0)
-#     grid += struct.pack('6f', 16.0, i - 16.0, 0.0, 0.0, 0.0, 0.0)
-
-# vbo = ctx.buffer(grid)
+# # The MVP is uploaded through a uniform buffer bound once to the block
+# prog['Matrices'].binding = 0
+# mat_ubo = ctx.buffer(reserve=64, dynamic=True)
+# mat_ubo.bind_to_uniform_block(0)
+# mat_ubo_write = mat_ubo.write
+
+# # 33 grid lines in each direction, 4 vertices (in_vert, in_color) per step
+# i = np.arange(-16, 17, dtype=np.float32)
+# z = np.zeros_like(i)
+# edge = np.full_like(i, 16.0)
+# verts = np.stack([
+#     np.stack([i, -edge, z], -1),
+#     np.stack([i, edge, z], -1),
+#     np.stack([-edge, i, z], -1),
+#     np.stack([edge, i, z], -1),
+# ], 1)
+# colors = np.zeros_like(verts)
+# grid = np.concatenate([verts, colors], -1)
+
+# # The grid is never rewritten, keep it in a static buffer
+# vbo = ctx.buffer(grid.tobytes(), dynamic=False)
 # vao = ctx.simple_vertex_array(prog, vbo, ['in_vert', 'in_color'])
 
+# lookat = look_at_f32(
+#     (40.0, 30.0, 20.0),
+#     (0.0, 0.0, 0.0),
+#     (0.0, 0.0, 1.0),
+# )
+
+# # The projection only changes with the window ratio
+# last_ratio = None
+# # std140 and GLSL store a mat4 column-major, a Fortran ordered array has that layout.
+# # Its transpose is C contiguous little-endian float32, the same bytes
+# # np.ascontiguousarray(mvp.T, dtype='<f4') would produce without a copy per frame.
+# mvp_f32 = np.empty((4, 4), dtype='<f4', order='F')
+# # Persistent byte view of the matrix, the upload allocates nothing per frame
+# mvp_bytes_view = memoryview(mvp_f32.T).cast('B')
+
 # while wnd.update():
 #     ctx.viewport = wnd.viewport
 #     ctx.clear(0.9, 0.9, 0.9)
 #     ctx.enable(ModernGL.DEPTH_TEST)
 
-#     proj = Matrix44.perspective_projection(45.0, wnd.ratio, 0.1, 1000.0)
-#     lookat = Matrix44.look_at(
-#         (40.0, 30.0, 20.0),
-#         (0.0, 0.0, 0.0),
-#         (0.0, 0.0, 1.0),
-#     )
+#     if wnd.ratio != last_ratio:
+#         proj = perspective_f32(45.0, wnd.ratio, 0.1, 1000.0)
+#         # Many matrices (e.g. a scene graph) can be stacked as (N, 4, 4) arrays
+#         # and multiplied at once with np.matmul(projs, views)
+#         np.matmul(proj, lookat, out=mvp_f32)
+#         last_ratio = wnd.ratio
 
-#     mvp.write((proj * lookat).astype('float32').tobytes())
+#     mat_ubo_write(mvp_bytes_view)
 #     vao.render(ModernGL.LINES)
@@ -1,8 +1,8 @@
-from typing import Any, Tuple
+from typing import Any, List, Sequence, Tuple
 
 from moderngl.mgl import InvalidObject  # type: ignore
 
-__all__ = ['Buffer']
+__all__ = ['Buffer', 'RingBuffer', 'PersistentBuffer']
 
 
 class Buffer:
@@ -43,13 +43,10 @@ class Buffer:
         return id(self)
 
     def __del__(self) -> None:
-        if not hasattr(self, "ctx"):
-            return
-
-        if self.ctx.gc_mode == "auto":
-            self.release()
-        elif self.ctx.gc_mode == "context_gc":
-            self.ctx.objects.append(self.mglo)
+        # ctx is missing or None for incomplete objects
+        ctx = getattr(self, 'ctx', None)
+        if ctx is not None:
+            ctx._gc_action(self)
 
     @property
     def size(self) -> int:
@@ -58,7 +55,12 @@ class Buffer:
 
     @property
     def dynamic(self) -> bool:
-        """bool: Is the buffer created with the dynamic flag?."""
+        """
+        bool: Is the buffer created with the dynamic flag?.
+
+        Dynamic buffers use the ``GL_DYNAMIC_DRAW`` usage hint, other buffers use ``GL_STATIC_DRAW``.
+        The same hint is used when the buffer is orphaned.
+        """
         return self._dynamic
 
     @property
@@ -70,18 +72,94 @@ class Buffer:
         """
         return self._glo
 
-    def write(self, data: Any, *, offset: int = 0) -> None:
+    def write(self, data: Any, *, offset: int = 0, orphan: bool = False) -> None:
         """
         Write the content.
 
+        The data can be any object supporting the buffer protocol
+        such as ``bytes``, ``bytearray``, ``array.array`` or a contiguous
+        numpy array. Calling ``tobytes()`` before writing is not needed
+        and only creates a copy of the data.
+
+        Writing to a buffer still used by previously issued render calls
+        may force the driver to wait for the GPU. Passing ``orphan=True``
+        re-specifies the storage with :py:meth:`orphan` before writing
+        so the write does not have to wait::
+
+            # Update the per frame data without waiting for the previous frame
+            ubo.write(data, orphan=True)
+
+        Orphaning discards the whole content of the buffer.
+        It should only be used when the entire buffer is rewritten.
+
         Args:
             data (bytes): The data.
 
         Keyword Args:
             offset (int): The offset in bytes.
+            orphan (bool): Orphan the buffer before writing.
         """
+        if orphan:
+            self.mglo.orphan(-1)
+
         self.mglo.write(data, offset)
 
+    def write_from(self, data: Any, *, offset: int = 0) -> None:
+        """
+        Write the content of a buffer protocol object without copying it.
+
+        The data is viewed as a flat sequence of bytes using ``memoryview(data).cast('B')``.
+        This makes it possible to upload typed or multi dimensional arrays
+        such as a ``(4, 4)`` float32 matrix in a render loop without allocating
+        a new ``bytes`` object every frame::
+
+            mvp = np.empty((4, 4), dtype='f4')
+            ubo = ctx.buffer(reserve=mvp.nbytes)
+
+            # In the render loop
+            np.matmul(proj, view, out=mvp)
+            ubo.write_from(mvp)
+
+        The data must be C contiguous. A ``ValueError`` is raised otherwise.
+
+        Args:
+            data (memoryview): The data.
+
+        Keyword Args:
+            offset (int): The offset in bytes.
+        """
+        data = memoryview(data)
+        if not data.c_contiguous:
+            raise ValueError('the data must be C contiguous')
+
+        self.mglo.write(data.cast('B'), offset)
+
+    def upload_from_persistent(
+        self,
+        src: 'PersistentBuffer',
+        size: int,
+        dst_offset: int = 0,
+        src_offset: int = 0,
+    ) -> None:
+        """
+        Copy the current region of a :py:class:`PersistentBuffer` into this buffer.
+
+        The copy is done on the GPU with ``glCopyBufferSubData``.
+        Afterwards the persistent buffer moves on to its next region,
+        see :py:meth:`Context.persistent_buffer`.
+
+        Args:
+            src (PersistentBuffer): The persistent buffer to copy from.
+            size (int): The number of bytes to copy.
+            dst_offset (int): The write offset in this buffer.
+            src_offset (int): The read offset in the current region of ``src``.
+        """
+        if src_offset < 0 or size < 0 or src_offset + size > src.size:
+            raise ValueError(f'out of range src_offset = {src_offset} or size = {size}')
+
+        self.ctx.mglo.copy_buffer(self.mglo, src._mglo, size, src.offset + src_offset, dst_offset)
+        src._advance()
+
     def write_chunks(self, data: Any, start: int, step: int, count: int) -> None:
         """
         Split data to count equal parts.
@@ -154,22 +232,31 @@ class Buffer:
         write_offset: int = 0
     ) -> None:
         """
-        Read the content.
+        Read the content into a buffer.
 
         Read and concatenate the chunks of size chunk_size
         using offsets calculated from start, step and stop.
 
+        Unlike :py:meth:`read_chunks` no new ``bytes`` object is created.
+        The receiving buffer can be allocated once and reused::
+
+            # Read the first 4 bytes of every 16 byte element
+            out = bytearray(4 * count)
+
+            # In the render loop
+            buf.read_chunks_into(out, 4, 0, 16, count)
+
         Args:
             buffer (bytearray): The buffer that will receive the content.
-            chunk_size (int): The chunk size.
-            start (int): First offset.
-            step (int): Offset increment.
+            chunk_size (int): The chunk size in bytes.
+            start (int): First offset in bytes.
+            step (int): Offset increment in bytes.
             count (int): The number of offsets.
 
         Keyword Args:
-            write_offset (int): The write offset.
+            write_offset (int): The write offset in bytes.
         """
-        return self.mglo.read(buffer, chunk_size, start, step, count, write_offset)
+        return self.mglo.read_chunks_into(buffer, chunk_size, start, step, count, write_offset)
 
     def clear(self, size: int = -1, *, offset: int = 0, chunk: Any = None) -> None:
         """
@@ -188,6 +275,19 @@ class Buffer:
         """
         Bind the buffer to a uniform block.
 
+        Updating many uniforms through a uniform buffer is usually cheaper than
+        individual uniform writes. The block binding of the program only needs
+        to be set once, after that the buffer can be rewritten every frame::
+
+            # layout(std140) uniform Matrices { mat4 Mvp; };
+            prog['Matrices'].binding = 0
+
+            ubo = ctx.buffer(reserve=64)
+            ubo.bind_to_uniform_block(0)
+
+            # In the render loop
+            ubo.write_from(mvp)
+
         Args:
             binding (int): The uniform block binding.
 
@@ -210,6 +310,52 @@ class Buffer:
         """
         self.mglo.bind_to_storage_buffer(binding, offset, size)
 
+    @staticmethod
+    def bind_many_uniform_blocks(entries: Sequence[Tuple['Buffer', int, int, int]]) -> None:
+        """
+        Bind multiple buffers to uniform blocks.
+
+        Each entry is a ``(buffer, binding, offset, size)`` tuple.
+        A size of ``-1`` means the rest of the buffer.
+        Entries with consecutive bindings are bound with a single
+        ``glBindBuffersRange`` call when OpenGL 4.4 is available::
+
+            moderngl.Buffer.bind_many_uniform_blocks([
+                (camera_ubo, 0, 0, -1),
+                (lights_ubo, 1, 0, -1),
+                (material_ubo, 2, 256, 64),
+            ])
+
+        All the buffers must belong to the same context.
+
+        Args:
+            entries (list): The ``(buffer, binding, offset, size)`` tuples.
+        """
+        if entries:
+            entries[0][0].ctx.mglo.bind_buffers_range(False, [
+                (buffer.mglo, binding, offset, size) for buffer, binding, offset, size in entries
+            ])
+
+    @staticmethod
+    def bind_many_storage_buffers(entries: Sequence[Tuple['Buffer', int, int, int]]) -> None:
+        """
+        Bind multiple buffers to shader storage buffers.
+
+        Each entry is a ``(buffer, binding, offset, size)`` tuple.
+        A size of ``-1`` means the rest of the buffer.
+        Entries with consecutive bindings are bound with a single
+        ``glBindBuffersRange`` call when OpenGL 4.4 is available.
+
+        All the buffers must belong to the same context.
+
+        Args:
+            entries (list): The ``(buffer, binding, offset, size)`` tuples.
+        """
+        if entries:
+            entries[0][0].ctx.mglo.bind_buffers_range(True, [
+                (buffer.mglo, binding, offset, size) for buffer, binding, offset, size in entries
+            ])
+
     def orphan(self, size: int = -1) -> None:
         """
         Orphan the buffer with the option to specify a new size.
@@ -258,6 +404,10 @@ class Buffer:
             # We can also resize the buffer. In this case we double the size
 
             >> vbo.orphan(vbo.size * 2)
+
+            # Orphaning and writing can also be done in a single call
+
+            >>> vbo.write(some_temporary_data, orphan=True)
         """
         self.mglo.orphan(size)
 
@@ -283,3 +433,217 @@ class Buffer:
             (self, index) tuple
         """
         return (self, index)
+
+
+class RingBuffer:
+    """
+    A round-robin of :py:class:`Buffer` objects for streaming uploads.
+
+    Rewriting a single buffer every frame may force the driver to wait for the GPU
+    to finish the render calls still using the old content.
+    A RingBuffer owns ``count`` buffers of the same size and every :py:meth:`write`
+    goes to the next buffer in turn, so the buffers used by the frames
+    still in flight are never modified.
+
+    .. code-block:: python
+
+        ring = moderngl.RingBuffer(ctx, 64, count=3)
+
+        # In the render loop
+        ring.write(mvp)
+        ring.bind_to_uniform_block(0)
+        vao.render()
+
+    Args:
+        ctx (Context): The context to create the buffers with.
+        size (int): The size of each buffer in bytes.
+        count (int): The number of buffers.
+
+    Keyword Args:
+        dynamic (bool): Treat the buffers as dynamic.
+    """
+
+    __slots__ = ['_buffers', '_index', 'ctx', 'extra']
+
+    def __init__(self, ctx: Any, size: int, count: int = 3, *, dynamic: bool = True):
+        if count < 1:
+            raise ValueError('count must be at least 1')
+
+        self._buffers = [ctx.buffer(reserve=size, dynamic=dynamic) for _ in range(count)]
+        self._index = 0
+        self.ctx = ctx  #: The context this object belongs to
+        self.extra = None  #: Any - Attribute for storing user defined objects
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {[buf.glo for buf in self._buffers]}>"
+
+    @property
+    def buffers(self) -> List[Buffer]:
+        """list: The buffers in the ring."""
+        return list(self._buffers)
+
+    @property
+    def current(self) -> Buffer:
+        """Buffer: The buffer written by the last :py:meth:`write` call."""
+        return self._buffers[self._index]
+
+    @property
+    def size(self) -> int:
+        """int: The size of each buffer in bytes."""
+        return self._buffers[0].size
+
+    def write(self, data: Any, *, offset: int = 0) -> None:
+        """
+        Advance to the next buffer and write the content.
+
+        The written buffer becomes :py:attr:`current`.
+
+        Args:
+            data (bytes): The data.
+
+        Keyword Args:
+            offset (int): The offset in bytes.
+        """
+        self._index = (self._index + 1) % len(self._buffers)
+        self._buffers[self._index].write(data, offset=offset)
+
+    def bind_to_uniform_block(self, binding: int = 0, *, offset: int = 0, size: int = -1) -> None:
+        """
+        Bind the current buffer to a uniform block.
+
+        Args:
+            binding (int): The uniform block binding.
+
+        Keyword Args:
+            offset (int): The offset.
+            size (int): The size. Value ``-1`` means all.
+        """
+        self._buffers[self._index].bind_to_uniform_block(binding, offset=offset, size=size)
+
+    def bind_to_storage_buffer(self, binding: int = 0, *, offset: int = 0, size: int = -1) -> None:
+        """
+        Bind the current buffer to a shader storage buffer.
+
+        Args:
+            binding (int): The shader storage binding.
+
+        Keyword Args:
+            offset (int): The offset.
+            size (int): The size. Value ``-1`` means all.
+        """
+        self._buffers[self._index].bind_to_storage_buffer(binding, offset=offset, size=size)
+
+    def release(self) -> None:
+        """Release all the buffers in the ring."""
+        for buf in self._buffers:
+            buf.release()
+
+
+class PersistentBuffer:
+    """
+    A staging buffer that stays mapped for the lifetime of the object.
+
+    The storage is created with ``glBufferStorage`` and mapped once with
+    ``GL_MAP_PERSISTENT_BIT | GL_MAP_COHERENT_BIT``.
+    It is split into ``count`` regions of :py:attr:`size` bytes.
+    The current region is written directly through :py:attr:`memoryview`
+    and copied into a regular buffer with :py:meth:`Buffer.upload_from_persistent`.
+    Every upload places a fence on the region it read and moves on to the next one,
+    waiting only if the GPU is still reading that region.
+
+    A PersistentBuffer object cannot be instantiated directly, it requires a context.
+    Use :py:meth:`Context.persistent_buffer` to create one.
+    """
+
+    __slots__ = ['_mglo', '_size', '_glo', '_view', '_views', '_fences', '_index', 'ctx', 'extra']
+
+    def __init__(self):
+        self._mglo = None
+        self._size = None  #: Size of each region
+        self._glo = None
+        self._view = None
+        self._views = None
+        self._fences = None
+        self._index = None
+        self.ctx = None  #: The context this object belongs to
+        self.extra = None  #: Any - Attribute for storing user defined objects
+        raise TypeError()
+
+    def __repr__(self) -> str:
+        if hasattr(self, '_glo'):
+            return f"<{self.__class__.__name__}: {self._glo}>"
+        else:
+            return f"<{self.__class__.__name__}: INCOMPLETE>"
+
+    def __del__(self) -> None:
+        # ctx is missing or None for incomplete objects
+        ctx = getattr(self, 'ctx', None)
+        if ctx is not None:
+            ctx._gc_action(self)
+
+    @property
+    def glo(self) -> int:
+        """int: The internal OpenGL object of the buffer holding all the regions."""
+        return self._glo
+
+    @property
+    def memoryview(self) -> memoryview:
+        """memoryview: Writable view of the current region."""
+        return self._views[self._index]
+
+    @property
+    def offset(self) -> int:
+        """int: The offset of the current region in bytes."""
+        return self._index * self._size
+
+    @property
+    def size(self) -> int:
+        """int: The size of each region in bytes."""
+        return self._size
+
+    @property
+    def count(self) -> int:
+        """int: The number of regions."""
+        return len(self._views)
+
+    def _advance(self) -> None:
+        mglo = self.ctx.mglo
+        self._fences[self._index] = mglo.fence_sync()
+        self._index = (self._index + 1) % len(self._views)
+
+        fence = self._fences[self._index]
+        if fence is not None:
+            mglo.client_wait_sync(fence, -1)
+            mglo.delete_sync(fence)
+            self._fences[self._index] = None
+
+    def release(self) -> None:
+        """
+        Release the buffer.
+
+        The views returned by :py:attr:`memoryview` are released as well.
+        Views derived from them, such as slices or numpy arrays,
+        keep the storage mapped and it is deleted once they are gone.
+        """
+        if self._view is None:
+            return
+
+        mglo = self.ctx.mglo
+        for fence in self._fences:
+            if fence is not None:
+                mglo.delete_sync(fence)
+
+        self._fences = [None] * len(self._views)
+
+        for view in self._views + [self._view]:
+            try:
+                view.release()
+            except BufferError:
+                # Exported to another object which keeps the mapping alive
+                pass
+
+        self._view = None
+
+        # A deferred delete runs as soon as the last view is released
+        if not isinstance(self._mglo, InvalidObject):
+            self._mglo.release()
@@ -4,7 +4,7 @@ from typing import Any, Deque, Dict, List, Optional, Set, Tuple, Union
 
 from moderngl.mgl import InvalidObject  # type: ignore
 
-from .buffer import Buffer
+from .buffer import Buffer, PersistentBuffer
 from .compute_shader import ComputeShader
 from .conditional_render import ConditionalRender
 from .framebuffer import Framebuffer
@@ -112,6 +112,30 @@ FIRST_VERTEX_CONVENTION = 0x8E4D
 LAST_VERTEX_CONVENTION = 0x8E4E
 
 
+# Finalizer actions for each gc mode.
+# Objects call ``ctx._gc_action(self)`` in ``__del__`` instead of comparing the mode strings.
+
+def _gc_ignore(obj: Any) -> None:
+    pass
+
+
+def _gc_release(obj: Any) -> None:
+    obj.release()
+
+
+def _gc_collect(obj: Any) -> None:
+    # Objects without an mglo such as pending reads or persistent buffers
+    # are queued themselves, gc() calls their release() the same way
+    obj.ctx._objects.append(getattr(obj, 'mglo', obj))
+
+
+_gc_actions = {
+    None: _gc_ignore,
+    "auto": _gc_release,
+    "context_gc": _gc_collect,
+}
+
+
 class Context:
     """
     Class exposing OpenGL features.
@@ -274,7 +298,9 @@ class Context:
     #: Used with :py:attr:`Context.provoking_vertex`.
     LAST_VERTEX_CONVENTION = 0x8E4E
 
-    __slots__ = ['mglo', '_screen', '_info', '_extensions', 'version_code', 'fbo', '_gc_mode', '_objects', 'extra']
+    __slots__ = [
+        'mglo', '_screen', '_info', '_extensions', 'version_code', 'fbo', '_gc_mode', '_gc_action', '_objects', 'extra',
+    ]
 
     def __init__(self):
         self.mglo = None  #: Internal representation for debug purposes only.
@@ -287,6 +313,7 @@ class Context:
         self.fbo = None
         self.extra = None  #: Any - Attribute for storing user defined objects
         self._gc_mode = None
+        self._gc_action = _gc_ignore
         self._objects: Deque[Any] = deque()
         raise TypeError()
 
@@ -336,6 +363,7 @@ class Context:
             raise ValueError("Valid  gc modes:", self._valid_gc_modes)
 
         self._gc_mode = value
+        self._gc_action = _gc_actions[value]
 
     @property
     def objects(self) -> Deque[Any]:
@@ -363,10 +391,19 @@ class Context:
         # Keep iterating until there are no more objects.
         # An object deletion can trigger new objects to be added
         while self._objects:
-            # Remove the oldest objects first
-            obj = self._objects.popleft()
-            obj.release()
-            count += 1
+            # Buffers and textures are deleted with a single glDeleteBuffers
+            # and glDeleteTextures call, the rest is queued again in order
+            objects = list(self._objects)
+            self._objects.clear()
+            remaining = self.mglo.release_many(objects)
+            self._objects.extendleft(reversed(remaining))
+            count += len(objects) - len(remaining)
+
+            # Remove the oldest objects first, a failing release keeps the rest queued
+            for _ in range(len(remaining)):
+                obj = self._objects.popleft()
+                obj.release()
+                count += 1
 
         return count
 
@@ -1142,12 +1179,24 @@ class Context:
         """
         Create a :py:class:`Buffer` object.
 
+        The ``dynamic`` flag is the usage hint passed to the driver.
+        Buffers are created with ``GL_STATIC_DRAW`` by default and with
+        ``GL_DYNAMIC_DRAW`` when ``dynamic=True``. The driver may use this to decide
+        where the buffer is stored. Static buffers are best filled once at creation,
+        frequently rewritten buffers should be dynamic::
+
+            # Vertex data that never changes
+            vbo = ctx.buffer(vertices, dynamic=False)
+
+            # Uniform data updated every frame
+            ubo = ctx.buffer(reserve=64, dynamic=True)
+
         Args:
             data (bytes): Content of the new buffer.
 
         Keyword Args:
             reserve (int): The number of bytes to reserve.
-            dynamic (bool): Treat buffer as dynamic.
+            dynamic (bool): Treat buffer as dynamic (``GL_DYNAMIC_DRAW`` instead of ``GL_STATIC_DRAW``).
 
         Returns:
             :py:class:`Buffer` object
@@ -1162,6 +1211,55 @@ class Context:
         res.extra = None
         return res
 
+    def persistent_buffer(self, size: int, *, count: int = 3) -> PersistentBuffer:
+        """
+        Create a :py:class:`PersistentBuffer` object for streaming uploads.
+
+        :py:meth:`Buffer.write` uploads with ``glBufferSubData``, which may stall
+        when the driver has to wait for the GPU to stop using the old content.
+        A persistent buffer stays mapped, the data is written into its
+        :py:attr:`~PersistentBuffer.memoryview` and copied on the GPU
+        into the destination buffer::
+
+            staging = ctx.persistent_buffer(64)
+            ubo = ctx.buffer(reserve=64)
+
+            # In the render loop
+            staging.memoryview[:] = mvp_bytes
+            ubo.upload_from_persistent(staging, 64)
+
+        The storage holds ``count`` regions of ``size`` bytes used in turn,
+        so the region the GPU may still be copying from is not overwritten.
+        This requires OpenGL 4.4 or ``ARB_buffer_storage``.
+
+        Args:
+            size (int): The size of each region in bytes.
+
+        Keyword Args:
+            count (int): The number of regions.
+
+        Returns:
+            :py:class:`PersistentBuffer` object
+        """
+        if type(size) is str:
+            size = mgl.strsize(size)
+
+        if count < 1:
+            raise ValueError('count must be at least 1')
+
+        res = PersistentBuffer.__new__(PersistentBuffer)
+        # No public mglo, context_gc queues the whole object so release() also deletes the fences
+        res._mglo, _, res._glo = self.mglo.persistent_buffer(size * count)
+        res._size = size
+        # The views keep the storage mapped, it is not deleted while they are in use
+        res._view = view = memoryview(res._mglo)
+        res._views = [view[i * size:(i + 1) * size] for i in range(count)]
+        res._fences = [None] * count
+        res._index = 0
+        res.ctx = self
+        res.extra = None
+        return res
+
     def external_texture(
         self,
         glo: int,
@@ -2004,6 +2102,7 @@ def create_context(
     ctx._extensions = None
     ctx.extra = None
     ctx._gc_mode = None
+    ctx._gc_action = _gc_ignore
     ctx._objects = deque()
 
     if ctx.version_code < require:
@@ -2060,6 +2159,7 @@ def create_standalone_context(
     ctx._extensions = None
     ctx.extra = None
     ctx._gc_mode = None
+    ctx._gc_action = _gc_ignore
     ctx._objects = deque()
 
     if require is not None and ctx.version_code < require:
@@ -92,6 +92,21 @@ class Program:
 
             # Still when writing byte data we need to use the `write()` method
             program['color'].write(buffer)
+
+        The members are collected once when the program is created,
+        so this is a plain dictionary lookup and no OpenGL call is made.
+        In a render loop it is still cheaper to look the members up once
+        outside the loop and keep the references:
+
+        .. code-block:: python
+
+            mvp = program['Mvp']
+
+            # In the render loop
+            mvp.write(camera_matrix)
+
+        When the names are only known at runtime the lookup
+        result can be stored in a dictionary owned by the caller.
         """
         return self._members[key]
 
@@ -1,7 +1,7 @@
 __all__ = ['Uniform']
 
 
-from typing import Any
+from typing import Any, Callable
 
 
 class Uniform:
@@ -173,6 +173,22 @@ class Uniform:
         """Read the value of the uniform."""
         return self.mglo.data
 
+    @property
+    def writer(self) -> Callable[[Any], None]:
+        """
+        callable: A pre-bound function writing the value of the uniform.
+
+        Calling the returned function is equivalent to :py:meth:`write`
+        without the Python attribute lookups. This can be useful in
+        tight render loops::
+
+            mvp = prog['Mvp'].writer
+
+            # In the render loop
+            mvp(matrix)
+        """
+        return self.mglo.write
+
     def write(self, data: Any) -> None:
         """Write the value of the uniform."""
         self.mglo.data = data
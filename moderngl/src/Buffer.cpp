@@ -52,6 +52,9 @@ PyObject * MGLContext_buffer(MGLContext * self, PyObject * args) {
 
 	buffer->size = (int)buffer_view.len;
 	buffer->dynamic = dynamic ? true : false;
+	buffer->persistent_map = 0;
+	buffer->persistent_exports = 0;
+	buffer->release_pending = false;
 
 	const GLMethods & gl = self->gl;
 
@@ -83,6 +86,76 @@ PyObject * MGLContext_buffer(MGLContext * self, PyObject * args) {
 	return result;
 }
 
+PyObject * MGLContext_persistent_buffer(MGLContext * self, PyObject * args) {
+	Py_ssize_t size;
+
+	int args_ok = PyArg_ParseTuple(
+		args,
+		"n",
+		&size
+	);
+
+	if (!args_ok) {
+		return 0;
+	}
+
+	if (size <= 0) {
+		MGLError_Set("the buffer cannot be empty");
+		return 0;
+	}
+
+	const GLMethods & gl = self->gl;
+
+	if (!gl.BufferStorage) {
+		MGLError_Set("persistent buffers are not supported");
+		return 0;
+	}
+
+	MGLBuffer * buffer = (MGLBuffer *)MGLBuffer_Type.tp_alloc(&MGLBuffer_Type, 0);
+
+	buffer->size = size;
+	buffer->dynamic = true;
+	buffer->persistent_exports = 0;
+	buffer->release_pending = false;
+
+	buffer->buffer_obj = 0;
+	gl.GenBuffers(1, (GLuint *)&buffer->buffer_obj);
+
+	if (!buffer->buffer_obj) {
+		MGLError_Set("cannot create buffer");
+		Py_DECREF(buffer);
+		return 0;
+	}
+
+	const int flags = GL_MAP_WRITE_BIT | GL_MAP_PERSISTENT_BIT | GL_MAP_COHERENT_BIT;
+
+	gl.BindBuffer(GL_ARRAY_BUFFER, buffer->buffer_obj);
+	gl.BufferStorage(GL_ARRAY_BUFFER, size, 0, flags);
+
+	// The storage stays mapped until the buffer is deleted
+	void * map = gl.MapBufferRange(GL_ARRAY_BUFFER, 0, size, flags);
+
+	if (!map) {
+		gl.DeleteBuffers(1, (GLuint *)&buffer->buffer_obj);
+		MGLError_Set("cannot map buffer");
+		Py_DECREF(buffer);
+		return 0;
+	}
+
+	buffer->persistent_map = map;
+
+	Py_INCREF(self);
+	buffer->context = self;
+
+	Py_INCREF(buffer);
+
+	PyObject * result = PyTuple_New(3);
+	PyTuple_SET_ITEM(result, 0, (PyObject *)buffer);
+	PyTuple_SET_ITEM(result, 1, PyLong_FromSsize_t(buffer->size));
+	PyTuple_SET_ITEM(result, 2, PyLong_FromLong(buffer->buffer_obj));
+	return result;
+}
+
 PyObject * MGLBuffer_tp_new(PyTypeObject * type, PyObject * args, PyObject * kwargs) {
 	MGLBuffer * self = (MGLBuffer *)type->tp_alloc(type, 0);
 
@@ -378,6 +451,17 @@ PyObject * MGLBuffer_read_chunks_into(MGLBuffer * self, PyObject * args) {
 		return 0;
 	}
 
+	Py_ssize_t abs_step = step > 0 ? step : -step;
+
+	if (start < 0) {
+		start = self->size + start;
+	}
+
+	if (start < 0 || chunk_size < 0 || chunk_size > abs_step || start + chunk_size > self->size || start + count * step - step < 0 || start + count * step - step + chunk_size > self->size) {
+		MGLError_Set("size error");
+		return 0;
+	}
+
 	Py_buffer buffer_view;
 
 	int get_buffer = PyObject_GetBuffer(data, &buffer_view, PyBUF_WRITABLE);
@@ -386,6 +470,12 @@ PyObject * MGLBuffer_read_chunks_into(MGLBuffer * self, PyObject * args) {
 		return 0;
 	}
 
+	if (write_offset < 0 || buffer_view.len < write_offset + chunk_size * count) {
+		MGLError_Set("the buffer is too small");
+		PyBuffer_Release(&buffer_view);
+		return 0;
+	}
+
 	const GLMethods & gl = self->context->gl;
 
 	gl.BindBuffer(GL_ARRAY_BUFFER, self->buffer_obj);
@@ -395,6 +485,7 @@ PyObject * MGLBuffer_read_chunks_into(MGLBuffer * self, PyObject * args) {
 
 	if (!read_ptr) {
 		MGLError_Set("cannot map the buffer");
+		PyBuffer_Release(&buffer_view);
 		return 0;
 	}
 
@@ -581,6 +672,15 @@ PyMethodDef MGLBuffer_tp_methods[] = {
 };
 
 int MGLBuffer_tp_as_buffer_get_view(MGLBuffer * self, Py_buffer * view, int flags) {
+	if (self->persistent_map) {
+		// The view keeps a reference to the buffer, the buffer is not deleted until it is released
+		if (PyBuffer_FillInfo(view, (PyObject *)self, self->persistent_map, self->size, 0, flags) < 0) {
+			return -1;
+		}
+		self->persistent_exports += 1;
+		return 0;
+	}
+
 	int access = (flags == PyBUF_SIMPLE) ? GL_MAP_READ_BIT : (GL_MAP_READ_BIT | GL_MAP_WRITE_BIT);
 
 	const GLMethods & gl = self->context->gl;
@@ -609,6 +709,14 @@ int MGLBuffer_tp_as_buffer_get_view(MGLBuffer * self, Py_buffer * view, int flag
 }
 
 void MGLBuffer_tp_as_buffer_release_view(MGLBuffer * self, Py_buffer * view) {
+	if (self->persistent_map) {
+		self->persistent_exports -= 1;
+		if (!self->persistent_exports && self->release_pending) {
+			MGLBuffer_Invalidate(self);
+		}
+		return;
+	}
+
 	const GLMethods & gl = self->context->gl;
 	gl.UnmapBuffer(GL_ARRAY_BUFFER);
 }
@@ -664,6 +772,12 @@ void MGLBuffer_Invalidate(MGLBuffer * buffer) {
 		return;
 	}
 
+	if (buffer->persistent_exports) {
+		// Deleted when the last view of the mapping is released
+		buffer->release_pending = true;
+		return;
+	}
+
 	const GLMethods & gl = buffer->context->gl;
 	gl.DeleteBuffers(1, (GLuint *)&buffer->buffer_obj);
 
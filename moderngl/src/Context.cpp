@@ -179,6 +179,75 @@ PyObject * MGLContext_finish(MGLContext * self) {
 	Py_RETURN_NONE;
 }
 
+PyObject * MGLContext_fence_sync(MGLContext * self) {
+	const GLMethods & gl = self->gl;
+	GLsync sync = gl.FenceSync(GL_SYNC_GPU_COMMANDS_COMPLETE, 0);
+
+	if (!sync) {
+		MGLError_Set("cannot create fence");
+		return 0;
+	}
+
+	// Make sure the fence reaches the GPU so polling it can succeed
+	gl.Flush();
+	return PyLong_FromVoidPtr((void *)sync);
+}
+
+PyObject * MGLContext_client_wait_sync(MGLContext * self, PyObject * args) {
+	PyObject * handle;
+	long long timeout;
+
+	int args_ok = PyArg_ParseTuple(
+		args,
+		"OL",
+		&handle,
+		&timeout
+	);
+
+	if (!args_ok) {
+		return 0;
+	}
+
+	GLsync sync = (GLsync)PyLong_AsVoidPtr(handle);
+
+	if (PyErr_Occurred()) {
+		return 0;
+	}
+
+	const GLMethods & gl = self->gl;
+
+	// A negative timeout waits until the fence is signaled
+	GLuint64 wait_timeout = timeout < 0 ? 1000000000ull : (GLuint64)timeout;
+
+	while (true) {
+		GLenum result = gl.ClientWaitSync(sync, GL_SYNC_FLUSH_COMMANDS_BIT, wait_timeout);
+
+		if (result == GL_ALREADY_SIGNALED || result == GL_CONDITION_SATISFIED) {
+			Py_RETURN_TRUE;
+		}
+
+		if (result == GL_WAIT_FAILED) {
+			MGLError_Set("cannot wait for the fence");
+			return 0;
+		}
+
+		if (timeout >= 0) {
+			Py_RETURN_FALSE;
+		}
+	}
+}
+
+PyObject * MGLContext_delete_sync(MGLContext * self, PyObject * handle) {
+	GLsync sync = (GLsync)PyLong_AsVoidPtr(handle);
+
+	if (PyErr_Occurred()) {
+		return 0;
+	}
+
+	self->gl.DeleteSync(sync);
+	Py_RETURN_NONE;
+}
+
 PyObject * MGLContext_copy_buffer(MGLContext * self, PyObject * args) {
 	MGLBuffer * dst;
 	MGLBuffer * src;
@@ -226,6 +295,196 @@ PyObject * MGLContext_copy_buffer(MGLContext * self, PyObject * args) {
 	Py_RETURN_NONE;
 }
 
+PyObject * MGLContext_bind_buffers_range(MGLContext * self, PyObject * args) {
+	int storage;
+	PyObject * entries;
+
+	int args_ok = PyArg_ParseTuple(
+		args,
+		"pO",
+		&storage,
+		&entries
+	);
+
+	if (!args_ok) {
+		return 0;
+	}
+
+	entries = PySequence_Fast(entries, "entries is not iterable");
+	if (!entries) {
+		return 0;
+	}
+
+	int num_entries = (int)PySequence_Fast_GET_SIZE(entries);
+
+	GLuint * buffers = new GLuint[num_entries];
+	GLintptr * offsets = new GLintptr[num_entries];
+	GLsizeiptr * sizes = new GLsizeiptr[num_entries];
+	int * bindings = new int[num_entries];
+
+	for (int i = 0; i < num_entries; ++i) {
+		MGLBuffer * buffer;
+		int binding;
+		Py_ssize_t offset;
+		Py_ssize_t size;
+
+		int entry_ok = PyArg_ParseTuple(
+			PySequence_Fast_GET_ITEM(entries, i),
+			"O!Inn",
+			&MGLBuffer_Type,
+			&buffer,
+			&binding,
+			&offset,
+			&size
+		);
+
+		if (!entry_ok) {
+			MGLError_Set("invalid entry %d", i);
+			delete[] buffers;
+			delete[] offsets;
+			delete[] sizes;
+			delete[] bindings;
+			Py_DECREF(entries);
+			return 0;
+		}
+
+		if (size < 0) {
+			size = buffer->size - offset;
+		}
+
+		buffers[i] = buffer->buffer_obj;
+		offsets[i] = (GLintptr)offset;
+		sizes[i] = (GLsizeiptr)size;
+		bindings[i] = binding;
+	}
+
+	Py_DECREF(entries);
+
+	const GLMethods & gl = self->gl;
+	GLenum target = storage ? GL_SHADER_STORAGE_BUFFER : GL_UNIFORM_BUFFER;
+
+	if (gl.BindBuffersRange) {
+		// Consecutive bindings are bound with a single call
+		int first = 0;
+		for (int i = 1; i <= num_entries; ++i) {
+			if (i == num_entries || bindings[i] != bindings[i - 1] + 1) {
+				gl.BindBuffersRange(target, bindings[first], i - first, buffers + first, offsets + first, sizes + first);
+				first = i;
+			}
+		}
+	} else {
+		for (int i = 0; i < num_entries; ++i) {
+			gl.BindBufferRange(target, bindings[i], buffers[i], offsets[i], sizes[i]);
+		}
+	}
+
+	delete[] buffers;
+	delete[] offsets;
+	delete[] sizes;
+	delete[] bindings;
+	Py_RETURN_NONE;
+}
+
+// Returns the context of the objects deleted in bulk by release_many or null for any other object
+MGLContext * MGLContext_batched_context(PyObject * obj) {
+	if (Py_TYPE(obj) == &MGLBuffer_Type) {
+		// Persistent buffers may still be exported and have to go through release
+		if (((MGLBuffer *)obj)->persistent_map) {
+			return 0;
+		}
+		return ((MGLBuffer *)obj)->context;
+	}
+	if (Py_TYPE(obj) == &MGLTexture_Type) {
+		return ((MGLTexture *)obj)->context;
+	}
+	if (Py_TYPE(obj) == &MGLTextureArray_Type) {
+		return ((MGLTextureArray *)obj)->context;
+	}
+	if (Py_TYPE(obj) == &MGLTexture3D_Type) {
+		return ((MGLTexture3D *)obj)->context;
+	}
+	return 0;
+}
+
+PyObject * MGLContext_release_many(MGLContext * self, PyObject * objects) {
+	objects = PySequence_Fast(objects, "objects is not iterable");
+	if (!objects) {
+		return 0;
+	}
+
+	int num_objects = (int)PySequence_Fast_GET_SIZE(objects);
+
+	GLuint * buffers = new GLuint[num_objects];
+	GLuint * textures = new GLuint[num_objects];
+	int num_buffers = 0;
+	int num_textures = 0;
+
+	for (int i = 0; i < num_objects; ++i) {
+		PyObject * obj = PySequence_Fast_GET_ITEM(objects, i);
+
+		if (MGLContext_batched_context(obj) != self) {
+			continue;
+		}
+
+		if (Py_TYPE(obj) == &MGLBuffer_Type) {
+			buffers[num_buffers++] = ((MGLBuffer *)obj)->buffer_obj;
+		} else if (Py_TYPE(obj) == &MGLTexture_Type) {
+			textures[num_textures++] = ((MGLTexture *)obj)->texture_obj;
+		} else if (Py_TYPE(obj) == &MGLTextureArray_Type) {
+			textures[num_textures++] = ((MGLTextureArray *)obj)->texture_obj;
+		} else {
+			textures[num_textures++] = ((MGLTexture3D *)obj)->texture_obj;
+		}
+	}
+
+	const GLMethods & gl = self->gl;
+
+	if (num_buffers) {
+		gl.DeleteBuffers(num_buffers, buffers);
+	}
+
+	if (num_textures) {
+		gl.DeleteTextures(num_textures, textures);
+	}
+
+	delete[] buffers;
+	delete[] textures;
+
+	// The deleted objects are invalidated before any other release can fail
+	for (int i = 0; i < num_objects; ++i) {
+		PyObject * obj = PySequence_Fast_GET_ITEM(objects, i);
+		MGLContext * context = MGLContext_batched_context(obj);
+
+		if (context == self) {
+			// Same as the Invalidate functions without the delete call.
+			// The sequence still holds a reference to the object.
+			Py_SET_TYPE(obj, &MGLInvalidObject_Type);
+			Py_DECREF(context);
+			Py_DECREF(obj);
+		}
+	}
+
+	// The other objects are returned in order to be released by the caller
+	PyObject * remaining = PyList_New(0);
+
+	for (int i = 0; i < num_objects; ++i) {
+		PyObject * obj = PySequence_Fast_GET_ITEM(objects, i);
+
+		if (Py_TYPE(obj) == &MGLInvalidObject_Type) {
+			continue;
+		}
+
+		if (PyList_Append(remaining, obj) < 0) {
+			Py_DECREF(remaining);
+			Py_DECREF(objects);
+			return 0;
+		}
+	}
+
+	Py_DECREF(objects);
+	return remaining;
+}
+
 PyObject * MGLContext_copy_framebuffer(MGLContext * self, PyObject * args) {
 	PyObject * dst;
 	MGLFramebuffer * src;
@@ -488,6 +747,7 @@ PyObject * MGLContext_clear_samplers(MGLContext * self, PyObject * args) {
 }
 
 PyObject * MGLContext_buffer(MGLContext * self, PyObject * args);
+PyObject * MGLContext_persistent_buffer(MGLContext * self, PyObject * args);
 PyObject * MGLContext_texture(MGLContext * self, PyObject * args);
 PyObject * MGLContext_texture3d(MGLContext * self, PyObject * args);
 PyObject * MGLContext_texture_array(MGLContext * self, PyObject * args);
@@ -526,12 +786,18 @@ PyMethodDef MGLContext_tp_methods[] = {
 	{"enable_direct", (PyCFunction)MGLContext_enable_direct, METH_VARARGS, 0},
 	{"disable_direct", (PyCFunction)MGLContext_disable_direct, METH_VARARGS, 0},
 	{"finish", (PyCFunction)MGLContext_finish, METH_NOARGS, 0},
+	{"fence_sync", (PyCFunction)MGLContext_fence_sync, METH_NOARGS, 0},
+	{"client_wait_sync", (PyCFunction)MGLContext_client_wait_sync, METH_VARARGS, 0},
+	{"delete_sync", (PyCFunction)MGLContext_delete_sync, METH_O, 0},
 	{"copy_buffer", (PyCFunction)MGLContext_copy_buffer, METH_VARARGS, 0},
+	{"bind_buffers_range", (PyCFunction)MGLContext_bind_buffers_range, METH_VARARGS, 0},
+	{"release_many", (PyCFunction)MGLContext_release_many, METH_O, 0},
 	{"copy_framebuffer", (PyCFunction)MGLContext_copy_framebuffer, METH_VARARGS, 0},
 	{"detect_framebuffer", (PyCFunction)MGLContext_detect_framebuffer, METH_VARARGS, 0},
 	{"clear_samplers", (PyCFunction)MGLContext_clear_samplers, METH_VARARGS, 0},
 
 	{"buffer", (PyCFunction)MGLContext_buffer, METH_VARARGS, 0},
+	{"persistent_buffer", (PyCFunction)MGLContext_persistent_buffer, METH_VARARGS, 0},
 	{"texture", (PyCFunction)MGLContext_texture, METH_VARARGS, 0},
 	{"texture3d", (PyCFunction)MGLContext_texture3d, METH_VARARGS, 0},
 	{"texture_array", (PyCFunction)MGLContext_texture_array, METH_VARARGS, 0},
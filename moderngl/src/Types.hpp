@@ -90,6 +90,11 @@ struct MGLBuffer {
 
 	Py_ssize_t size;
 	bool dynamic;
+
+	// Only set for persistent buffers, the mapping is exported through the buffer protocol
+	void * persistent_map;
+	int persistent_exports;
+	bool release_pending;
 };
 
 struct MGLComputeShader {
@@ -55,6 +55,18 @@ int MGLUniform_set_data(MGLUniform * self, PyObject * value, void * closure) {
 	return 0;
 }
 
+PyObject * MGLUniform_write(MGLUniform * self, PyObject * data) {
+	if (MGLUniform_set_data(self, data, 0) < 0) {
+		return 0;
+	}
+	Py_RETURN_NONE;
+}
+
+PyMethodDef MGLUniform_tp_methods[] = {
+	{"write", (PyCFunction)MGLUniform_write, METH_O, 0},
+	{0},
+};
+
 PyGetSetDef MGLUniform_tp_getseters[] = {
 	{(char *)"value", (getter)MGLUniform_get_value, (setter)MGLUniform_set_value, 0, 0},
 	{(char *)"data", (getter)MGLUniform_get_data, (setter)MGLUniform_set_data, 0, 0},
@@ -89,7 +101,7 @@ PyTypeObject MGLUniform_Type = {
 	0,                                                      // tp_weaklistoffset
 	0,                                                      // tp_iter
 	0,                                                      // tp_iternext
-	0,                                                      // tp_methods
+	MGLUniform_tp_methods,                                  // tp_methods
 	0,                                                      // tp_members
 	MGLUniform_tp_getseters,                                // tp_getset
 	0,                                                      // tp_base
@@ -2,9 +2,8 @@ from typing import Any, Optional, Tuple, Union
 
 from moderngl.mgl import InvalidObject  # type: ignore
 
-from .buffer import Buffer
 
-__all__ = ['TextureArray']
+__all__ = ['TextureArray', 'PendingRead']
 
 
 class TextureArray:
@@ -45,13 +44,10 @@ class TextureArray:
         return id(self)
 
     def __del__(self):
-        if not hasattr(self, "ctx"):
-            return
-
-        if self.ctx.gc_mode == "auto":
-            self.release()
-        elif self.ctx.gc_mode == "context_gc":
-            self.ctx.objects.append(self.mglo)
+        # ctx is missing or None for incomplete objects
+        ctx = getattr(self, 'ctx', None)
+        if ctx is not None:
+            ctx._gc_action(self)
 
     @property
     def repeat_x(self) -> bool:
@@ -222,7 +218,8 @@ class TextureArray:
         *,
         alignment: int = 1,
         write_offset: int = 0,
-    ) -> None:
+        asynchronous: bool = False,
+    ) -> Optional['PendingRead']:
         """
         Read the content of the texture array into a bytearray or :py:class:`~moderngl.Buffer`.
 
@@ -239,18 +236,68 @@ class TextureArray:
             texture = ctx.texture((2, 2, 2), 1)
             texture.read_into(data)
 
+        Reading into a bytearray waits for the GPU to finish rendering to the texture.
+        With ``asynchronous=True`` the pixels are first read into a temporary
+        :py:class:`~moderngl.Buffer` and a :py:class:`PendingRead` is returned.
+        The bytearray is filled when the read is polled or waited on::
+
+            data = bytearray(8)
+            pending = texture.read_into(data, asynchronous=True)
+
+            # Do some other work
+            ...
+
+            if pending.done:
+                process(data)
+
+            # Or block until the data is available
+            pending.wait()
+
         Args:
             buffer (Union[bytearray, Buffer]): The buffer that will receive the pixels.
 
         Keyword Args:
             alignment (int): The byte alignment of the pixels.
             write_offset (int): The write offset.
+            asynchronous (bool): Do not wait for the pixels and return a :py:class:`PendingRead`.
+
+        Returns:
+            :py:class:`PendingRead` if ``asynchronous`` is set, ``None`` otherwise
         """
-        if type(buffer) is Buffer:
-            buffer = buffer.mglo
+        if asynchronous:
+            return self._read_into_async(buffer, alignment, write_offset)
 
+        buffer = getattr(buffer, 'mglo', buffer)
         return self.mglo.read_into(buffer, alignment, write_offset)
 
+    def _read_into_async(self, buffer: Any, alignment: int, write_offset: int) -> 'PendingRead':
+        res = PendingRead.__new__(PendingRead)
+        res.ctx = self.ctx
+        res._write_offset = write_offset
+        res._released = False
+
+        mglo = getattr(buffer, 'mglo', None)
+        if mglo is not None:
+            # The pixels stay on the GPU, only the fence is needed
+            self.mglo.read_into(mglo, alignment, write_offset)
+            res._pbo = None
+            res._buffer = None
+        else:
+            row_size = self.width * self.components * int(self._dtype[-1])
+            row_size = (row_size + alignment - 1) // alignment * alignment
+            size = row_size * self.height * self.layers
+
+            if memoryview(buffer).nbytes < write_offset + size:
+                raise ValueError('the buffer is too small')
+
+            res._pbo = self.ctx.buffer(reserve=size)
+            res._buffer = buffer
+            self.mglo.read_into(res._pbo.mglo, alignment, 0)
+
+        res._fence = self.ctx.mglo.fence_sync()
+        res.extra = None
+        return res
+
     def write(
         self,
         data: Any,
@@ -270,8 +317,9 @@ class TextureArray:
             # Writing sub-sections of the array
             texture.write(data, viewport=(x, y, layer, width, height, num_layers))
 
-        Like with other texture types we can also use bytes or :py:class:`~moderngl.Buffer`
-        as a source::
+        Like with other texture types we can also use bytes, any C contiguous object
+        supporting the buffer protocol such as a numpy array or :py:class:`~moderngl.Buffer`
+        as a source. Passing a numpy array directly avoids the copy made by ``tobytes()``::
 
             # Using a moderngl buffer
             data = ctx.buffer(reserve=8)
@@ -283,6 +331,14 @@ class TextureArray:
             texture = ctx.texture_array((2, 2, 2), 1)
             texture.write(data)
 
+            # Using a numpy array
+            data = np.full((2, 2, 2), 255, dtype='u1')
+            texture = ctx.texture_array((2, 2, 2), 1)
+            texture.write(data)
+
+        Non contiguous data such as a strided numpy view raises a ``ValueError``,
+        the same as :py:meth:`Buffer.write_from`.
+
         Args:
             data (bytes): The pixel data.
             viewport (tuple): The viewport.
@@ -290,8 +346,15 @@ class TextureArray:
         Keyword Args:
             alignment (int): The byte alignment of the pixels.
         """
-        if type(data) is Buffer:
-            data = data.mglo
+        # Buffer objects and subclasses are passed as their mglo
+        mglo = getattr(data, 'mglo', None)
+        if mglo is not None:
+            data = mglo
+        elif not isinstance(data, (bytes, bytearray)):
+            data = memoryview(data)
+            if not data.c_contiguous:
+                raise ValueError('the pixel data must be C contiguous')
+            data = data.cast('B')
 
         self.mglo.write(data, viewport, alignment)
 
@@ -378,3 +441,102 @@ class TextureArray:
         """Release the ModernGL object."""
         if not isinstance(self.mglo, InvalidObject):
             self.mglo.release()
+
+
+class PendingRead:
+    """
+    A texture read that has been issued but may not be completed yet.
+
+    PendingRead objects are returned by :py:meth:`TextureArray.read_into`
+    with ``asynchronous=True``. The pixel data is copied into the
+    receiving buffer the first time :py:attr:`done` returns ``True``
+    or when :py:meth:`wait` returns. The temporary buffer and fence are
+    released at the same time, so every pending read should eventually
+    be waited on or dropped with :py:meth:`release`.
+    """
+
+    __slots__ = ['_fence', '_pbo', '_buffer', '_write_offset', '_released', 'ctx', 'extra']
+
+    def __init__(self):
+        self._fence = None
+        self._pbo = None
+        self._buffer = None
+        self._write_offset = None
+        self._released = None
+        self.ctx = None  #: The context this object belongs to
+        self.extra = None  #: Any - Attribute for storing user defined objects
+        raise TypeError()
+
+    def __repr__(self) -> str:
+        if self._released:
+            state = 'released'
+        else:
+            state = 'pending' if self._fence is not None else 'done'
+        return f"<{self.__class__.__name__}: {state}>"
+
+    def __del__(self) -> None:
+        # ctx is missing or None for incomplete objects
+        ctx = getattr(self, 'ctx', None)
+        if ctx is not None:
+            ctx._gc_action(self)
+
+    @property
+    def done(self) -> bool:
+        """
+        bool: Is the data available? This never blocks.
+
+        A released read never completes, ``False`` is returned.
+        """
+        if self._released:
+            return False
+
+        if self._fence is not None:
+            if not self.ctx.mglo.client_wait_sync(self._fence, 0):
+                return False
+            self._complete()
+        return True
+
+    def wait(self) -> None:
+        """
+        Block until the data is available in the receiving buffer.
+
+        A ``ValueError`` is raised if the read was released.
+        """
+        if self._released:
+            raise ValueError('the read was released')
+
+        if self._fence is not None:
+            self.ctx.mglo.client_wait_sync(self._fence, -1)
+            self._complete()
+
+    def release(self) -> None:
+        """
+        Release the fence and the temporary buffer without waiting.
+
+        Pixels that were not copied yet are discarded
+        and the receiving buffer is left untouched.
+        Releasing a completed read has no effect.
+        """
+        if self._fence is None and self._pbo is None:
+            return
+
+        self._released = True
+
+        if self._fence is not None:
+            self.ctx.mglo.delete_sync(self._fence)
+            self._fence = None
+
+        if self._pbo is not None:
+            self._pbo.release()
+            self._pbo = None
+            self._buffer = None
+
+    def _complete(self) -> None:
+        self.ctx.mglo.delete_sync(self._fence)
+        self._fence = None
+
+        if self._pbo is not None:
+            self._pbo.read_into(self._buffer, write_offset=self._write_offset)
+            self._pbo.release()
+            self._pbo = None
+            self._buffer = None
@@ -1,3 +1,7 @@
+import array
+import gc
+import struct
+import sys
 import unittest
 
 import moderngl
@@ -35,6 +39,16 @@ class TestBuffer(unittest.TestCase):
         self.assertEqual(buf.read(), b'abcabcabcd')
         self.assertEqual(buf.read(offset=3), b'abcabcd')
 
+    def test_buffer_write_from(self):
+        buf = self.ctx.buffer(reserve=12)
+        buf.write_from(array.array('f', [1.0, 2.0, 3.0]))
+        self.assertEqual(buf.read(), struct.pack('3f', 1.0, 2.0, 3.0))
+        buf.write_from(memoryview(b'abcd'), offset=8)
+        self.assertEqual(buf.read(4, offset=8), b'abcd')
+
+        with self.assertRaises(ValueError):
+            buf.write_from(memoryview(b'abcdefgh')[::2])
+
     def test_buffer_read_into_1(self):
         data = b'Hello World!'
         buf = self.ctx.buffer(data)
@@ -50,10 +64,27 @@ class TestBuffer(unittest.TestCase):
         buf.read_into(res, offset=0, size=5, write_offset=5)
         self.assertEqual(bytes(res), b'WorldHello')
 
+    def test_buffer_incomplete(self):
+        errors = []
+        hook, sys.unraisablehook = sys.unraisablehook, errors.append
+        try:
+            with self.assertRaises(TypeError):
+                moderngl.Buffer()
+            gc.collect()
+        finally:
+            sys.unraisablehook = hook
+        self.assertEqual(errors, [])
+
     def test_buffer_orphan(self):
         buf = self.ctx.buffer(reserve=1024)
         buf.orphan()
 
+    def test_buffer_write_orphan(self):
+        buf = self.ctx.buffer(b'abcd')
+        buf.write(b'xyzw', orphan=True)
+        self.assertEqual(buf.read(), b'xyzw')
+        self.assertEqual(buf.size, 4)
+
     def test_buffer_orphan_resize(self):
         buf = self.ctx.buffer(reserve=10)
         self.assertEqual(buf.size, 10)
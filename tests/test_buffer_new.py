@@ -56,6 +56,14 @@ class TestCase(unittest.TestCase):
         buf = self.ctx.buffer(b'123456789')
         self.assertEqual(buf.read_chunks(3, 0, 3, 3), b'123456789')
 
+    def test_read_chunks_into(self):
+        buf = self.ctx.buffer(b'AA3BB6CC9')
+        data = bytearray(8)
+        buf.read_chunks_into(data, 2, 0, 3, 3, write_offset=2)
+        self.assertEqual(bytes(data[2:]), b'AABBCC')
+        buf.read_chunks_into(data, 1, -1, -3, 3)
+        self.assertEqual(bytes(data[:3]), b'963')
+
     def test_8(self):
         buf1 = self.ctx.buffer(b'abc', dynamic=True)
         buf2 = self.ctx.buffer(b'abc', dynamic=False)
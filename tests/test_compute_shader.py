@@ -2,6 +2,8 @@ from array import array
 import struct
 import unittest
 
+import moderngl
+
 from common import get_context
 
 
@@ -50,6 +52,42 @@ class TestCase(unittest.TestCase):
         self.assertAlmostEqual(c, 2.0)
         self.assertAlmostEqual(d, 1.0)
 
+    def test_bind_many_storage_buffers(self):
+        compute_shader = self.ctx.compute_shader('''
+            #version 430
+
+            layout (local_size_x = 1, local_size_y = 1) in;
+
+            layout (std430, binding = 1) buffer Input {
+                float v1[2];
+            };
+
+            layout (std430, binding = 2) buffer Output {
+                float v2[2];
+            };
+
+            void main() {
+                v2[0] = v1[1];
+                v2[1] = v1[0];
+            }
+        ''')
+
+        buf1 = self.ctx.buffer(struct.pack('4f', 1.0, 2.0, 3.0, 4.0))
+        buf2 = self.ctx.buffer(struct.pack('2f', 0.0, 0.0))
+
+        moderngl.Buffer.bind_many_storage_buffers([
+            (buf1, 1, 0, 8),
+            (buf2, 2, 0, -1),
+        ])
+
+        compute_shader.run()
+
+        a, b = struct.unpack('2f', buf2.read())
+
+        self.assertAlmostEqual(a, 2.0)
+        self.assertAlmostEqual(b, 1.0)
+        self.assertEqual(self.ctx.error, 'GL_NO_ERROR')
+
     def test_image(self):
         texture = self.ctx.texture((100, 100), 4)
         texture.bind_to_image(0, read=True, write=True)
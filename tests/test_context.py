@@ -185,6 +185,71 @@ class ContextTests(TestCase):
             ctx.gc_mode = "something"
         ctx.release()
 
+    def test_context_gc_mode_switch(self):
+        """Objects follow the gc mode active when they are destroyed"""
+        ctx = moderngl.create_context(standalone=True)
+        buff = ctx.buffer(reserve=1024)
+        tex_array = ctx.texture_array((10, 10, 10), 4)
+
+        ctx.gc_mode = "context_gc"
+        buff = None
+        tex_array = None
+        self.assertEqual(ctx.gc(), 2)
+
+        ctx.gc_mode = "auto"
+        buff = ctx.buffer(reserve=1024)
+        mglo = buff.mglo
+        buff = None
+        self.assertEqual(len(ctx.objects), 0)
+        self.assertIsInstance(mglo, moderngl.mgl.InvalidObject)
+        ctx.release()
+
+    def test_context_gc_batched(self):
+        """Buffers and textures queued together are deleted in one sweep"""
+        ctx = moderngl.create_context(standalone=True)
+        ctx.gc_mode = "context_gc"
+
+        objects = [ctx.buffer(reserve=16) for _ in range(4)]
+        objects += [ctx.texture((4, 4), 4), ctx.texture_array((4, 4, 4), 4), ctx.texture3d((4, 4, 4), 4)]
+        objects.append(ctx.sampler())
+        mglos = [obj.mglo for obj in objects]
+        objects = None
+
+        self.assertEqual(ctx.gc(), 8)
+        self.assertEqual(len(ctx.objects), 0)
+        for mglo in mglos:
+            self.assertIsInstance(mglo, moderngl.mgl.InvalidObject)
+        self.assertEqual(ctx.error, "GL_NO_ERROR")
+        ctx.release()
+
+    def test_context_gc_failing_release(self):
+        """A failing release keeps the objects that were not released queued"""
+        class Failing:
+            def release(self):
+                raise RuntimeError('release failed')
+
+        ctx = moderngl.create_context(standalone=True)
+        ctx.gc_mode = "context_gc"
+        ctx.objects.append(Failing())
+
+        buffers = [ctx.buffer(reserve=16) for _ in range(3)]
+        fbo = ctx.framebuffer(ctx.renderbuffer((4, 4)))
+        mglos = [obj.mglo for obj in buffers]
+        fbo_mglo = fbo.mglo
+        buffers = fbo = None
+
+        with self.assertRaises(RuntimeError):
+            ctx.gc()
+
+        for mglo in mglos:
+            self.assertIsInstance(mglo, moderngl.mgl.InvalidObject)
+        self.assertIn(fbo_mglo, ctx.objects)
+
+        ctx.gc()
+        self.assertEqual(len(ctx.objects), 0)
+        self.assertIsInstance(fbo_mglo, moderngl.mgl.InvalidObject)
+        ctx.release()
+
     def test_context_gc(self):
         """Simple usage of context_gc"""
         ctx = moderngl.create_context(standalone=True)
@@ -54,12 +54,21 @@ class TestCase(unittest.TestCase):
     def test_buffer_docs(self):
         self.validate_cls('buffer.rst', 'Buffer', [])
 
+    def test_ring_buffer_docs(self):
+        self.validate_cls('ring_buffer.rst', 'RingBuffer', [])
+
+    def test_persistent_buffer_docs(self):
+        self.validate_cls('persistent_buffer.rst', 'PersistentBuffer', [])
+
     def test_texture_docs(self):
         self.validate_cls('texture.rst', 'Texture', [])
 
     def test_texture_array_docs(self):
         self.validate_cls('texture_array.rst', 'TextureArray', [])
 
+    def test_pending_read_docs(self):
+        self.validate_cls('texture_array.rst', 'PendingRead', [])
+
     def test_texture3d_docs(self):
         self.validate_cls('texture3d.rst', 'Texture3D', [])
 
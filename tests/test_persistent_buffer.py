@@ -0,0 +1,109 @@
+import unittest
+
+import moderngl
+
+from common import get_context
+
+
+class TestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ctx = get_context()
+        if cls.ctx.version_code < 440 and 'GL_ARB_buffer_storage' not in cls.ctx.extensions:
+            raise unittest.SkipTest('persistent buffers are not supported')
+
+    def test_upload(self):
+        staging = self.ctx.persistent_buffer(4, count=3)
+        self.assertEqual(staging.size, 4)
+        self.assertEqual(staging.count, 3)
+        self.assertEqual(staging.memoryview.nbytes, 4)
+
+        dst = self.ctx.buffer(reserve=8)
+        for data in (b'aaaa', b'bbbb', b'cccc', b'dddd'):
+            staging.memoryview[:] = data
+            dst.upload_from_persistent(staging, 4, dst_offset=4)
+
+        # The fourth upload wraps around to the first region
+        self.assertEqual(staging.offset, 4)
+        self.assertEqual(dst.read(4, offset=4), b'dddd')
+        staging.release()
+        dst.release()
+
+    def test_upload_offset(self):
+        staging = self.ctx.persistent_buffer(8)
+        staging.memoryview[:] = b'abcdefgh'
+
+        dst = self.ctx.buffer(reserve=4)
+        dst.upload_from_persistent(staging, 4, src_offset=2)
+        self.assertEqual(dst.read(), b'cdef')
+
+        with self.assertRaises(ValueError):
+            dst.upload_from_persistent(staging, 4, src_offset=6)
+
+        staging.release()
+        dst.release()
+
+    def test_release(self):
+        staging = self.ctx.persistent_buffer(4)
+        view = staging.memoryview
+        staging.release()
+
+        with self.assertRaises(ValueError):
+            view[:] = b'aaaa'
+
+    def test_slice_outlives_release(self):
+        staging = self.ctx.persistent_buffer(4)
+        mglo = staging._mglo
+        part = staging.memoryview[:2]
+        staging.release()
+
+        # The storage stays mapped until the last view is released
+        part[:] = b'aa'
+        self.assertNotIsInstance(mglo, moderngl.mgl.InvalidObject)
+        part.release()
+        self.assertIsInstance(mglo, moderngl.mgl.InvalidObject)
+
+    def test_inner_release(self):
+        staging = self.ctx.persistent_buffer(4)
+        mglo = staging._mglo
+        mglo.release()
+
+        # The views handed out are still exported, the delete is deferred
+        staging.memoryview[:] = b'aaaa'
+        self.assertNotIsInstance(mglo, moderngl.mgl.InvalidObject)
+        staging.release()
+        self.assertIsInstance(mglo, moderngl.mgl.InvalidObject)
+
+    def test_view_outlives_object(self):
+        ctx = moderngl.create_context(standalone=True)
+
+        for gc_mode in ('auto', 'context_gc'):
+            ctx.gc_mode = gc_mode
+            staging = ctx.persistent_buffer(4)
+            mglo = staging._mglo
+            # Leaves a fence on the first region
+            ctx.buffer(reserve=4).upload_from_persistent(staging, 4)
+            view = staging.memoryview
+            part = view[:2]
+            staging = None
+
+            if gc_mode == 'context_gc':
+                # Queued whole so gc() also deletes the fences
+                self.assertIsInstance(ctx.objects[-1], moderngl.PersistentBuffer)
+                ctx.gc()
+
+            # The view handed out is released with the object
+            with self.assertRaises(ValueError):
+                view[:] = b'aaaa'
+
+            part[:] = b'aa'
+            self.assertNotIsInstance(mglo, moderngl.mgl.InvalidObject)
+            view = part = None
+            self.assertIsInstance(mglo, moderngl.mgl.InvalidObject)
+
+        ctx.release()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+
+import moderngl
+
+from common import get_context
+
+
+class TestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ctx = get_context()
+
+    def test_rotate(self):
+        ring = moderngl.RingBuffer(self.ctx, 4, count=3)
+        self.assertEqual(len(ring.buffers), 3)
+        self.assertEqual(ring.size, 4)
+
+        ring.write(b'aaaa')
+        first = ring.current
+        ring.write(b'bbbb')
+        second = ring.current
+        ring.write(b'cccc')
+        ring.write(b'dddd')
+
+        # The fourth write wraps around to the first buffer
+        self.assertNotEqual(first, second)
+        self.assertEqual(first, ring.current)
+        self.assertEqual(first.read(), b'dddd')
+        self.assertEqual(second.read(), b'bbbb')
+        ring.release()
+
+    def test_bind(self):
+        ring = moderngl.RingBuffer(self.ctx, 16, count=2)
+        ring.write(b'\x00' * 16)
+        ring.bind_to_uniform_block(0)
+        ring.release()
+
+    def test_invalid_count(self):
+        with self.assertRaises(ValueError):
+            moderngl.RingBuffer(self.ctx, 4, count=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
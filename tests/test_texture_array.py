@@ -1,5 +1,7 @@
 import unittest
 
+import numpy as np
+
 import moderngl
 
 from common import get_context
@@ -44,3 +46,70 @@ class TestCase(unittest.TestCase):
         for dtype in ["u1", "u2", "u4", "i1", "i2", "i4"]:
             texture = self.ctx.texture_array((10, 10, 10), 4, dtype=dtype)
             self.assertEqual(texture.filter, (moderngl.NEAREST, moderngl.NEAREST))
+
+    def test_write_numpy(self):
+        data = np.arange(2 * 2 * 2 * 4, dtype='f4').reshape(2, 2, 2, 4)
+        texture = self.ctx.texture_array((2, 2, 2), 4, dtype='f4')
+        texture.write(data)
+        self.assertEqual(texture.read(), data.tobytes())
+
+    def test_write_buffer(self):
+        data = np.arange(2 * 2 * 2 * 4, dtype='u1')
+        buf = self.ctx.buffer(data)
+        texture = self.ctx.texture_array((2, 2, 2), 4)
+        texture.write(buf)
+        self.assertEqual(texture.read(), data.tobytes())
+
+    def test_write_not_contiguous(self):
+        data = np.zeros((2, 2, 4), dtype='u1')
+        texture = self.ctx.texture_array((2, 2, 1), 2)
+        with self.assertRaises(ValueError):
+            texture.write(data[:, :, ::2])
+
+    def test_read_into_async(self):
+        data = np.arange(2 * 2 * 2 * 4, dtype='u1')
+        texture = self.ctx.texture_array((2, 2, 2), 4, data)
+
+        res = bytearray(2 + data.nbytes)
+        pending = texture.read_into(res, write_offset=2, asynchronous=True)
+        pending.wait()
+        self.assertTrue(pending.done)
+        self.assertEqual(bytes(res[2:]), data.tobytes())
+
+    def test_read_into_async_release(self):
+        data = np.arange(2 * 2 * 2 * 4, dtype='u1')
+        texture = self.ctx.texture_array((2, 2, 2), 4, data)
+
+        res = bytearray(data.nbytes)
+        pending = texture.read_into(res, asynchronous=True)
+        pbo = pending._pbo
+        pending.release()
+        self.assertFalse(pending.done)
+        with self.assertRaises(ValueError):
+            pending.wait()
+        self.assertIsInstance(pbo.mglo, moderngl.mgl.InvalidObject)
+        self.assertEqual(res, bytearray(data.nbytes))
+        pending.release()
+
+    def test_read_into_async_gc(self):
+        ctx = moderngl.create_context(standalone=True)
+        texture = ctx.texture_array((2, 2, 2), 4)
+
+        for gc_mode in ('auto', 'context_gc'):
+            ctx.gc_mode = gc_mode
+            pending = texture.read_into(bytearray(2 * 2 * 2 * 4), asynchronous=True)
+            pbo = pending._pbo
+            pending = None
+            ctx.gc()
+            self.assertIsInstance(pbo.mglo, moderngl.mgl.InvalidObject)
+
+        ctx.release()
+
+    def test_read_into_async_buffer(self):
+        data = np.arange(2 * 2 * 2 * 4, dtype='u1')
+        texture = self.ctx.texture_array((2, 2, 2), 4, data)
+
+        buf = self.ctx.buffer(reserve=data.nbytes)
+        pending = texture.read_into(buf, asynchronous=True)
+        pending.wait()
+        self.assertEqual(buf.read(), data.tobytes())
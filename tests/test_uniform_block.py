@@ -1,6 +1,8 @@
 import struct
 import unittest
 
+import moderngl
+
 from common import get_context
 
 
@@ -113,6 +115,34 @@ class TestCase(unittest.TestCase):
         self.assertAlmostEqual(a, 9.5)
         self.assertAlmostEqual(b, 4.0)
 
+    def test_bind_many_uniform_blocks(self):
+        buf_v = self.ctx.buffer(struct.pack('2f', 100.0, 1000.0))
+        buf_u1 = self.ctx.buffer(struct.pack('f', 9.5))
+        buf_u2 = self.ctx.buffer(struct.pack('f', 4.0))
+        buf_u3 = self.ctx.buffer(struct.pack('f', 3.0))
+        buf_r = self.ctx.buffer(reserve=buf_v.size)
+
+        vao = self.ctx.vertex_array(self.prog, [
+            (buf_v, '2f', 'in_v'),
+        ])
+
+        # Bindings 0, 1 and 3 are bound as two separate runs
+        self.prog['Block1'].binding = 0
+        self.prog['Block2'].binding = 1
+        self.prog['Block3'].binding = 3
+
+        moderngl.Buffer.bind_many_uniform_blocks([
+            (buf_u1, 0, 0, -1),
+            (buf_u2, 1, 0, -1),
+            (buf_u3, 3, 0, -1),
+        ])
+
+        vao.transform(buf_r)
+        a, b = struct.unpack('2f', buf_r.read())
+        self.assertAlmostEqual(a, 309.5)
+        self.assertAlmostEqual(b, 3004.0)
+        self.assertEqual(self.ctx.error, 'GL_NO_ERROR')
+
 
 if __name__ == '__main__':
     unittest.main()
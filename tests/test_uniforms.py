@@ -122,6 +122,31 @@ class TestCase(unittest.TestCase):
         self.assertAlmostEqual(m[4], 4.0)
         self.assertAlmostEqual(m[5], 5.0)
 
+    def test_uniform_writer(self):
+        prog = self.ctx.program(
+            vertex_shader='''
+                #version 330
+                uniform vec2 Uniform;
+                in vec2 v_in;
+                out vec2 v_out;
+                void main() {
+                    v_out = Uniform * v_in;
+                }
+            ''',
+            varyings=['v_out']
+        )
+
+        vbo = self.ctx.buffer(struct.pack('2f', 1.0, 1.0))
+        vao = self.ctx.simple_vertex_array(prog, vbo, 'v_in')
+
+        write = prog['Uniform'].writer
+        write(struct.pack('2f', 2.0, 3.0))
+        vao.transform(self.res)
+
+        x, y = struct.unpack('2f', self.res.read(8))
+        self.assertAlmostEqual(x, 2.0)
+        self.assertAlmostEqual(y, 3.0)
+
     def test_sampler_2d(self):
         """RGBA8 2d sampler"""
         prog = self.ctx.program(vertex_shader="""